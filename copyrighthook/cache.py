@@ -0,0 +1,35 @@
+"""Small pickle-based caches stored in the git directory."""
+
+import os
+import pickle  # nosec
+from pathlib import Path
+from typing import Any, Dict
+
+# Bump when the layout of cached objects changes
+CACHE_FORMAT_VERSION = 1
+
+
+def load_cache(path: Path) -> Dict[Any, Any]:
+    """Load cache dict from `path`, missing or broken cache is treated as empty."""
+    try:
+        with path.open("rb") as cache_file:
+            version, cache = pickle.load(cache_file)  # nosec
+    except Exception:  # pylint: disable=broad-except
+        return {}
+    return cache if version == CACHE_FORMAT_VERSION and isinstance(cache, dict) else {}
+
+
+def store_cache(path: Path, cache: Dict[Any, Any], max_entries: int) -> None:
+    """Store the last `max_entries` entries of `cache` to `path`, errors are ignored.
+
+    The file is replaced atomically because pre-commit may run several hook processes at once.
+    """
+    while len(cache) > max_entries:
+        del cache[next(iter(cache))]
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as cache_file:
+            pickle.dump((CACHE_FORMAT_VERSION, cache), cache_file)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
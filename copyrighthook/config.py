@@ -4,21 +4,32 @@ from typing import Optional, Any, Callable, Dict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+from copyrighthook.cache import load_cache, store_cache
 from copyrighthook.years_pattern import YearsPattern
 
+CONFIG_CACHE_FILENAME = "copyrighthook-config.cache"
+CONFIG_CACHE_SIZE = 5
+
 
 class CopyrightConfig:
     license_file: PurePath
     ignore_commits_before: Optional[datetime.datetime]
     pattern: YearsPattern
+    detect_renames: bool
 
     def __init__(self, config: Dict[str, object]) -> None:
         self._raw = config
         self.ignore_commits_before = self._get(
             "ignore_commits_before", parser=self._parse_datetime, default=None
         )
-        self.pattern = self._get("pattern", parser=YearsPattern, types=str)
+        self.pattern = self._get("pattern", parser=YearsPattern.get, types=str)
         self.license_file = self._get("license_file", parser=PurePath, default=PurePath("LICENSE"), types=str)
+        self.detect_renames = self._get("detect_renames", default=True, types=bool)
 
     def _get(
         self, key: str, *, types: Any = None, parser: Optional[Callable[[Any], Any]] = None, **kwargs: Any
@@ -45,7 +56,30 @@ class CopyrightConfig:
         raise ValueError(f"expected timestamp or null, found {value}")
 
     @staticmethod
-    def load_from_file(path: Path) -> "CopyrightConfig":
+    def load_from_file(path: Path, cache_dir: Optional[Path] = None) -> "CopyrightConfig":
+        """Load config from YAML file.
+
+        Args:
+            path: Path to the config file.
+            cache_dir: Directory to keep parsed configs in, keyed by path, mtime and size of the file.
+        """
+        if cache_dir is None:
+            return CopyrightConfig(CopyrightConfig._parse_file(path))
+
+        stat = path.stat()
+        key = (str(path.absolute()), stat.st_mtime_ns, stat.st_size)
+        cache_path = cache_dir / CONFIG_CACHE_FILENAME
+        cache = load_cache(cache_path)
+        if cache and next(reversed(cache)) == key:
+            # Most recently used entry, nothing to update
+            return CopyrightConfig(cache[key])
+        raw_config = cache.pop(key) if key in cache else CopyrightConfig._parse_file(path)
+        config = CopyrightConfig(raw_config)
+        cache[key] = raw_config
+        store_cache(cache_path, cache, CONFIG_CACHE_SIZE)
+        return config
+
+    @staticmethod
+    def _parse_file(path: Path) -> Any:
         with path.open(encoding="utf-8") as config_file:
-            config = CopyrightConfig(yaml.load(config_file, Loader=yaml.SafeLoader))
-            return config
+            return yaml.load(config_file, Loader=_SafeLoader)
@@ -2,10 +2,14 @@
 
 import argparse
 import datetime
+import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePath
-from typing import Optional, Dict, Sequence, List, Union, Callable, Iterable
+from typing import Optional, Dict, Sequence, List, Union, Callable, Iterable, Tuple
 
+from copyrighthook.cache import load_cache, store_cache
 from copyrighthook.config import CopyrightConfig
 from copyrighthook.git_utilities import (
     GitCommitInfo,
@@ -26,6 +30,10 @@ OUTSIDE_OF_REPOSITORY = "outside ot the repository"
 NO_COPYRIGHT_HEADER_FOUND = "no copyright comment found"
 RANGE_USED_FOR_A_SINGLE_YEAR = "range syntax is used for a single year"
 
+HISTORY_CACHE_FILENAME = "copyrighthook-history.cache"
+HISTORY_CACHE_SIZE = 2
+READ_WORKERS = 8
+
 
 class FatalException(Exception):
     def __init__(self, message: str, file: Optional[Path] = None, extra: Optional[str] = None) -> None:
@@ -42,15 +50,68 @@ class FatalException(Exception):
         self.file = file
 
 
-def compute_last_modified_dict(commits: Sequence[GitCommitInfo]) -> Dict[PurePath, datetime.datetime]:
-    last_modified_dict: Dict[PurePath, datetime.datetime] = {}
+def load_last_modified_dict(
+    repo: GitRepository, config: CopyrightConfig
+) -> Tuple[Dict[PurePath, datetime.datetime], Optional[datetime.datetime]]:
+    """Build mapping (file -> last committed datetime), reusing results of previous runs.
+
+    Results are cached in the git directory per HEAD commit. When HEAD moves forward without merges
+    only the new commits are loaded from git.
+
+    Returns:
+        The mapping and datetime of the latest commit.
+    """
+    head = repo.head()
+    if head is None:
+        return {}, None
+    cache_path = repo.git_dir / HISTORY_CACHE_FILENAME
+    cache = load_cache(cache_path)
+    key = (config.ignore_commits_before, config.detect_renames)
+    cached_head, cached_dict, cached_last_commit_datetime = cache.get(key, (None, None, None))
+    if cached_head == head:
+        return cached_dict, cached_last_commit_datetime
+
+    if cached_head is not None and can_extend_history(repo, cached_head, head):
+        last_modified_dict, last_commit_datetime = repo.last_modified_per_file(
+            since=config.ignore_commits_before,
+            detect_renames=config.detect_renames,
+            revisions=f"{cached_head}..{head}",
+            last_modified=cached_dict,
+        )
+        last_commit_datetime = last_commit_datetime or cached_last_commit_datetime
+    else:
+        last_modified_dict, last_commit_datetime = repo.last_modified_per_file(
+            since=config.ignore_commits_before, detect_renames=config.detect_renames, revisions=head
+        )
+    cache.pop(key, None)
+    cache[key] = (head, last_modified_dict, last_commit_datetime)
+    store_cache(cache_path, cache, HISTORY_CACHE_SIZE)
+    return last_modified_dict, last_commit_datetime
+
+
+def can_extend_history(repo: GitRepository, old_head: str, new_head: str) -> bool:
+    """Check that history of `new_head` is history of `old_head` followed by `old_head..new_head`.
+
+    Merged commits may be older than `old_head`, a full scan orders them by date, so they can't
+    be applied on top of the mapping built for `old_head`.
+    """
+    if repo.command_fails(["git", "merge-base", "--is-ancestor", old_head, new_head]):
+        return False
+    return repo.run_command(["git", "rev-list", "--merges", "--count", f"{old_head}..{new_head}"]) == "0"
+
+
+def compute_last_modified_dict(
+    commits: Sequence[GitCommitInfo], last_modified_dict: Optional[Dict[PurePath, datetime.datetime]] = None
+) -> Dict[PurePath, datetime.datetime]:
+    if last_modified_dict is None:
+        last_modified_dict = {}
     for commit in reversed(commits):
         for src, dst in commit.changes.moved_files:
-            if src in last_modified_dict:
+            src_modified = last_modified_dict.get(src)
+            if src_modified is not None:
                 # `src` may be missing in dict in case only part of history is loaded
-                last_modified_dict[dst] = last_modified_dict[src]
-        for file in commit.changes.changed_files:
-            last_modified_dict[file] = commit.author_date
+                last_modified_dict[dst] = src_modified
+        last_modified_dict.update(dict.fromkeys(commit.changes.changed_files, commit.author_date))
     return last_modified_dict
 
 
@@ -95,23 +156,25 @@ def run_copyright_updater(args_list: List[str], *, now: Optional[datetime.dateti
     # Load config file
     try:
         print_verbose(f"Loading config from {config_path}")
-        config = CopyrightConfig.load_from_file(config_path)
+        config = CopyrightConfig.load_from_file(config_path, cache_dir=repo.git_dir)
     except ValueError as err:
         raise FatalException(INVALID_CONFIGURATION, config_path, extra=str(err)) from err
 
     # Scan commit history and build mapping (file -> last committed datetime)
-    commits = repo.commits(since=config.ignore_commits_before)
-    if staged_changes := repo.staged_changeset():
-        # Add pseudo-commit for staged changes
-        commits.insert(0, GitCommitInfo(now, staged_changes))
-    if not commits:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Independent git calls, run them concurrently
+        staged_changes_future = executor.submit(repo.staged_changeset, detect_renames=config.detect_renames)
+        last_modified_dict, last_repo_modification_datetime = load_last_modified_dict(repo, config)
+        staged_changes = staged_changes_future.result()
+    if staged_changes:
+        # Apply pseudo-commit for staged changes
+        compute_last_modified_dict([GitCommitInfo(now, staged_changes)], last_modified_dict)
+        last_repo_modification_datetime = now
+    if last_repo_modification_datetime is None:
         print_verbose("No staged changes and no commits")
         return False
 
-    last_repo_modification_datetime: Optional[datetime.datetime] = commits[0].author_date
-    last_modified_dict = compute_last_modified_dict(commits)
-
-    success = True
+    files_to_check: List[Tuple[PurePath, str]] = []
     for rel_path in files:
         # Determine last year when that file was changed
         if rel_path != config.license_file:
@@ -135,16 +198,20 @@ def run_copyright_updater(args_list: List[str], *, now: Optional[datetime.dateti
             print_verbose(f"Ignoring '{rel_path}' because it is too old")
             continue
 
-        expected_year = str(last_change_datetime.year)
+        files_to_check.append((rel_path, str(last_change_datetime.year)))
+
+    # Read files concurrently to overlap I/O
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        contents = list(executor.map(read_text, [repo.root / rel_path for rel_path, _ in files_to_check]))
 
+    success = True
+    for (rel_path, expected_year), content in zip(files_to_check, contents):
         # Check copyright header is correct
         full_path = repo.root / rel_path
-        try:
-            content = Path(full_path).read_text("utf-8")
-        except UnicodeDecodeError:
+        if content is None:
             print_verbose(f"'{rel_path}': is not valid utf-8 text file, skipping")
             continue
-        error_comment, content = update_file(
+        error_comment, new_content = update_file(
             content,
             last_year=expected_year,
             pattern=config.pattern,
@@ -154,8 +221,8 @@ def run_copyright_updater(args_list: List[str], *, now: Optional[datetime.dateti
         success &= error_comment is None
         if error_comment:
             print(f"File '{rel_path}': {error_comment}")
-            if not args.dry_run:
-                Path(full_path).write_text(content, "utf-8")
+            if not args.dry_run and new_content != content:
+                Path(full_path).write_text(new_content, "utf-8")
         elif args.verbose:
             years = config.pattern.extract(content)
             print_verbose(f"File '{rel_path}': ok, {'no header' if not years else expected_year}")
@@ -163,16 +230,39 @@ def run_copyright_updater(args_list: List[str], *, now: Optional[datetime.dateti
     return not success
 
 
+def read_text(path: Path) -> Optional[str]:
+    """Read utf-8 text file, returns None if file is not valid utf-8."""
+    try:
+        return path.read_text("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
 def validate_and_resolve_files(files: Iterable[Path], repo: GitRepository) -> List[PurePath]:
     staged_files = set(repo.staged_files())
     files_relative_to_repo_root: List[PurePath] = []
+    cwd = os.getcwd()
+    # Files usually share a few directories, so resolve each directory only once
+    resolved_dirs: Dict[str, str] = {}
     file_arg: Path
     for file_arg in files:
-        if not file_arg.exists():
-            raise FatalException(NOT_EXISTS, file_arg)
-        if not file_arg.is_file():
+        try:
+            file_stat = os.lstat(file_arg)
+            is_symlink = stat.S_ISLNK(file_stat.st_mode)
+            if is_symlink:
+                file_stat = os.stat(file_arg)
+        except OSError as exc:
+            raise FatalException(NOT_EXISTS, file_arg) from exc
+        if not stat.S_ISREG(file_stat.st_mode):
             raise FatalException(NOT_A_FILE, file_arg)
-        abs_path = file_arg.absolute().resolve()
+        if is_symlink:
+            abs_path = file_arg.absolute().resolve()
+        else:
+            dir_name, file_name = os.path.split(os.path.join(cwd, file_arg))
+            resolved_dir = resolved_dirs.get(dir_name)
+            if resolved_dir is None:
+                resolved_dir = resolved_dirs[dir_name] = os.path.realpath(dir_name)
+            abs_path = Path(resolved_dir, file_name)
         if not abs_path.is_relative_to(repo.root):
             raise FatalException(OUTSIDE_OF_REPOSITORY, file_arg)
         file_rel = abs_path.relative_to(repo.root)
@@ -186,9 +276,21 @@ def find_config_path(args_config: Optional[Path], config_root: Path) -> Path:
     if args_config:
         return args_config
     default_config_names = [".copyright-updater.yaml", ".copyright-updater.yml"]
+    # Single directory read instead of a stat per candidate name
+    try:
+        with os.scandir(config_root) as entries:
+            existing_names = {
+                entry.name for entry in entries if entry.name in default_config_names and entry.is_file()
+            }
+    except OSError:
+        existing_names = set()
+    for config_filename in default_config_names:
+        if config_filename in existing_names:
+            return config_root / config_filename
+    # Names may differ in case on case-insensitive filesystems
     for config_filename in default_config_names:
         config_path = config_root / config_filename
-        if config_path.exists():
+        if config_path.is_file():
             return config_path
     raise FatalException(
         NO_CONFIG_FOUND, extra="searched for " + ", ".join(default_config_names) + f" in {config_root}"
@@ -203,28 +305,31 @@ def update_file(
     required: bool = False,
 ) -> tuple[Optional[str], str]:
     """Update the copyright header of the file content."""
-    years = pattern.extract(content)
-    if years is None:
+    years_match = pattern.search(content)
+    if years_match is None:
         if required:
             return NO_COPYRIGHT_HEADER_FOUND, content
         return None, content
+
+    def replace(new_range: Union[tuple[str, str], str]) -> str:
+        return pattern.replace_match(years_match, content, new_range)
+
+    years = pattern.extract_match(years_match)
     if isinstance(years, tuple):
         y_from, y_to = years
         if y_from == y_to:
             err_message = RANGE_USED_FOR_A_SINGLE_YEAR
             if y_from == current_year:
-                return err_message, pattern.replace(content, current_year)
-            return err_message, pattern.replace(content, (y_from, current_year))
+                return err_message, replace(current_year)
+            return err_message, replace((y_from, current_year))
         if last_year == y_to:
             return None, content
-        return f"expected year {last_year}, actual is {y_to}", pattern.replace(
-            content, (y_from, current_year)
-        )
+        return f"expected year {last_year}, actual is {y_to}", replace((y_from, current_year))
     # years is str
     if years == last_year:
         return None, content
     new_range = (years, current_year)
-    return f"expected year {last_year}, actual is {years}", pattern.replace(content, new_range)
+    return f"expected year {last_year}, actual is {years}", replace(new_range)
 
 
 def main() -> None:
@@ -1,10 +1,10 @@
 import dataclasses
 import datetime
-import itertools
 import subprocess  # nosec
+import tempfile
 from dataclasses import field
 from pathlib import PurePath, Path
-from typing import Union, List, Optional
+from typing import Dict, Iterator, Union, List, Optional, Tuple
 
 
 @dataclasses.dataclass
@@ -20,15 +20,16 @@ class GitChangeSet:
         self.moved_files = []
         for item in self.items:
             change_type, *extra_files, dst = item
-            self.touched_files.add(PurePath(dst))
+            dst_path = PurePath(dst)
+            self.touched_files.add(dst_path)
             if change_type.startswith("R"):
                 # File moved (possibly with changes)
                 if change_type != "R100":
-                    self.changed_files.add(PurePath(dst))
-                self.moved_files.append((PurePath(extra_files[0]), PurePath(dst)))
+                    self.changed_files.add(dst_path)
+                self.moved_files.append((PurePath(extra_files[0]), dst_path))
             else:
                 # File changed/added/copied/deleted/...
-                self.changed_files.add(PurePath(dst))
+                self.changed_files.add(dst_path)
 
     def __bool__(self) -> bool:
         return bool(self.items)
@@ -70,7 +71,11 @@ class GitRepository:
     def __init__(self, directory: Union[str, Path]) -> None:
         self.root = Path(directory)
         try:
-            self.root = Path(self.run_command(["git", "rev-parse", "--show-toplevel"]))
+            root, git_dir = self.run_command(
+                ["git", "rev-parse", "--show-toplevel", "--absolute-git-dir"]
+            ).splitlines()
+            self.root = Path(root)
+            self.git_dir = Path(git_dir)
         except GitMissingException:
             raise
         except GitCallException as exc:
@@ -92,6 +97,29 @@ class GitRepository:
         except subprocess.CalledProcessError as exc:
             raise GitCallException(f"git exited with {exc.returncode}: {exc.stderr.strip()}") from exc
 
+    def stream_command(self, args: List[str]) -> Iterator[str]:
+        """Run command and yield its output line by line without buffering all of it."""
+        # stderr goes to a file: a pipe read only after stdout could fill up and block git
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                with subprocess.Popen(
+                    args,
+                    encoding="utf-8",
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    cwd=str(self.root),
+                ) as process:  # nosec
+                    assert process.stdout is not None  # nosec
+                    for line in process.stdout:
+                        yield line.removesuffix("\n")
+                    return_code = process.wait()
+            except FileNotFoundError as exc:
+                raise GitMissingException() from exc
+            if return_code != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+                raise GitCallException(f"git exited with {return_code}: {stderr.strip()}")
+
     def command_fails(self, args: List[str]) -> bool:
         result = subprocess.run(
             args,
@@ -103,34 +131,73 @@ class GitRepository:
         )  # nosec
         return result.returncode != 0
 
-    def commits(self, since: Optional[datetime.datetime] = None) -> List[GitCommitInfo]:
-        if self.command_fails(["git", "rev-parse", "HEAD"]):
-            # no commits yet
-            return []
-
-        # Get git log
-        extra_args = []
-        if since:
-            extra_args += ["--since", since.isoformat()]
-        log = self.run_command(["git", "log", "--name-status", "--pretty=format:%aI", *extra_args])
-        # Parse command output
-        commits = []
-        for block in log.split("\n\n"):
-            if not block:
-                # possible on empty logs
+    def head(self) -> Optional[str]:
+        """Return hash of HEAD commit or None if there are no commits yet."""
+        try:
+            return self.run_command(["git", "rev-parse", "--verify", "--quiet", "HEAD"])
+        except GitMissingException:
+            raise
+        except GitCallException:
+            return None
+
+    def last_modified_per_file(
+        self,
+        since: Optional[datetime.datetime] = None,
+        detect_renames: bool = True,
+        revisions: str = "HEAD",
+        last_modified: Optional[Dict[PurePath, datetime.datetime]] = None,
+    ) -> Tuple[Dict[PurePath, datetime.datetime], Optional[datetime.datetime]]:
+        """Find last modification datetime of each file in a single pass over git log.
+
+        Args:
+            since: Ignore commits before that datetime.
+            detect_renames: Whether moved files keep modification datetime of their source.
+            revisions: Commits to scan, there must be at least one commit in the repository.
+            last_modified: Mapping for history preceding `revisions`, updated in place.
+
+        Returns:
+            Mapping (file -> last modification datetime) and datetime of the latest scanned commit.
+        """
+        if last_modified is None:
+            last_modified = {}
+        commit_datetime: Optional[datetime.datetime] = None
+        for line in self.stream_command(self._log_args(since, detect_renames, revisions, reverse=True)):
+            if not line:
                 continue
-            block_lines = [line for line in block.split("\n") if line]
-            # There may be extra timestamps in a block (from commits without file changes)
-            timestamp_lines = list(itertools.takewhile(lambda p: "\t" not in p, block_lines))
-            for extra_timestamp in timestamp_lines[:-1]:
-                commits.append(GitCommitInfo(extra_timestamp))
-            commit_datetime = timestamp_lines[-1]
-            change_lines = block_lines[len(timestamp_lines) :]
-            commits.append(GitCommitInfo(commit_datetime, GitChangeSet.parse(change_lines)))
-        return commits
-
-    def staged_changeset(self) -> GitChangeSet:
-        return GitChangeSet.parse(self.run_command(["git", "diff", "--name-status", "--cached"]))
+            if "\t" not in line:
+                commit_datetime = datetime.datetime.fromisoformat(line)
+                continue
+            assert commit_datetime is not None  # nosec
+            change_type, *extra_files, dst = line.split("\t")
+            if change_type == "R100":
+                # File moved without changes
+                src_modified = last_modified.get(PurePath(extra_files[0]))
+                if src_modified is not None:
+                    last_modified[PurePath(dst)] = src_modified
+            else:
+                last_modified[PurePath(dst)] = commit_datetime
+        return last_modified, commit_datetime
+
+    def staged_changeset(self, detect_renames: bool = True) -> GitChangeSet:
+        return GitChangeSet.parse(
+            self.run_command(["git", "diff", "--name-status", "--cached", self._renames_arg(detect_renames)])
+        )
+
+    @classmethod
+    def _log_args(
+        cls, since: Optional[datetime.datetime], detect_renames: bool, revisions: str, reverse: bool = False
+    ) -> List[str]:
+        args = ["git", "log", "--name-status", "--pretty=format:%aI", cls._renames_arg(detect_renames)]
+        if reverse:
+            args.append("--reverse")
+        if since:
+            args += ["--since", since.isoformat()]
+        return [*args, revisions]
+
+    @staticmethod
+    def _renames_arg(detect_renames: bool) -> str:
+        # Rename detection is expensive for large changes, allow to skip it
+        return "-M" if detect_renames else "--no-renames"
 
     def staged_files(self) -> set[PurePath]:
         return set(PurePath(p) for p in self.run_command(["git", "ls-files", "--cached"]).splitlines())
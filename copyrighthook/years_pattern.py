@@ -1,14 +1,18 @@
 import re
-from typing import Union
+from functools import lru_cache
+from typing import Match, Optional, Union
 
 
 class YearsPattern:
     """Can search for copyright header & replace years in it."""
 
     placeholder = "{years}"
-    r_single_year = r"(?P<year>\d+)"
-    r_year_range = r"(?P<from>\d+)\s*-\s*(?P<to>\d+)"
+    # Groups are numbered: 1 and 2 for range, 3 for single year
+    group_from, group_to, group_year = 1, 2, 3
+    r_single_year = r"(\d+)"
+    r_year_range = r"(\d+)\s*-\s*(\d+)"
     r_year_or_range = rf"\s*(?:{r_year_range}|{r_single_year})\s*"
+    header_size = 4096
 
     def __init__(self, pattern: str) -> None:
         """Init YearsPattern.
@@ -21,30 +25,73 @@ class YearsPattern:
 
         p_start = pattern.find(self.placeholder)
         p_end = p_start + len(self.placeholder)
-        re_pattern = re.escape(pattern[:p_start]) + self.r_year_or_range + re.escape(pattern[p_end:])
-        self.regexp = re.compile(re_pattern)
+        self.prefix = pattern[:p_start]
+        self.suffix = pattern[p_end:]
+        re_pattern = re.escape(self.prefix) + self.r_year_or_range + re.escape(self.suffix)
+        self.regexp = re.compile(re_pattern, re.ASCII)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get(pattern: str) -> "YearsPattern":
+        """Get YearsPattern instance, reusing instances created for the same pattern."""
+        return YearsPattern(pattern)
+
+    def search(self, content: str) -> Optional[Match[str]]:
+        if self.prefix:
+            # Every match starts with the literal prefix: find candidates with fast substring search
+            # and check only them with anchored regexp
+            position = content.find(self.prefix)
+            while position != -1:
+                regexp_match = self.regexp.match(content, position)
+                if regexp_match:
+                    return regexp_match
+                position = content.find(self.prefix, position + 1)
+            return None
+        if self.suffix not in content:
+            # Cheap check before running unanchored regexp
+            return None
+
+        # Copyright headers are at the top of files, so look there first
+        regexp_match = self.regexp.search(content, 0, self.header_size)
+        if regexp_match:
+            # The window may cut the match short (e.g. leave only the first year of a range),
+            # so match again at the same position in the whole content
+            return self.regexp.match(content, regexp_match.start())
+        if len(content) <= self.header_size:
+            return None
+        return self.regexp.search(content)
 
     def extract(self, content: str) -> Union[str, tuple[str, str], None]:
-        regexp_match = self.regexp.search(content)
+        regexp_match = self.search(content)
         if not regexp_match:
             return None
-        match_groups = regexp_match.groupdict()
-        if match_groups["from"] and match_groups["to"]:
-            # year range
-            return match_groups["from"], match_groups["to"]
-        # single year
-        return match_groups["year"]
+        return self.extract_match(regexp_match)
 
     def replace(self, content: str, new_range: Union[tuple[str, str], str]) -> str:
-        regexp_match = self.regexp.search(content)
+        regexp_match = self.search(content)
         if not regexp_match:
             raise ValueError("no copyright years in content")
-        match_groups = regexp_match.groupdict()
+        return self.replace_match(regexp_match, content, new_range)
+
+    @classmethod
+    def extract_match(cls, regexp_match: Match[str]) -> Union[str, tuple[str, str]]:
+        """Extract years from match returned by `search`."""
+        y_from, y_to, year = regexp_match.group(cls.group_from, cls.group_to, cls.group_year)
+        if y_from and y_to:
+            # year range
+            return y_from, y_to
+        # single year
+        return year
 
-        if match_groups["from"] and match_groups["to"]:
+    @classmethod
+    def replace_match(
+        cls, regexp_match: Match[str], content: str, new_range: Union[tuple[str, str], str]
+    ) -> str:
+        """Replace years found by `search` in the same content."""
+        if regexp_match.group(cls.group_to):
             # found year range
-            from_start, from_end = regexp_match.span("from")
-            to_start, to_end = regexp_match.span("to")
+            from_start, from_end = regexp_match.span(cls.group_from)
+            to_start, to_end = regexp_match.span(cls.group_to)
             if isinstance(new_range, tuple):
                 r_from, r_to = new_range
                 return content[:from_start] + r_from + content[from_end:to_start] + r_to + content[to_end:]
@@ -52,5 +99,5 @@ class YearsPattern:
 
         # found year
         formatted_new_range = "-".join(new_range) if isinstance(new_range, tuple) else str(new_range)
-        start, end = regexp_match.span("year")
+        start, end = regexp_match.span(cls.group_year)
         return content[:start] + formatted_new_range + content[end:]
@@ -49,20 +49,28 @@ class TestRepository:
 
     def commit(self):
         self.commit_counter += 1
-        self.repo.run_command(
-            [
-                "git",
-                "commit",
-                "--allow-empty",
-                "-m",
-                f"commit{self.commit_counter}",
-                "--date",
-                self.current_dt.isoformat(),
-            ]
-        )
-
-    def generate_config(self, pattern: str, ignore_commits_before: Optional[datetime.datetime] = None):
+        self.run_dated_command(["git", "commit", "--allow-empty", "-m", f"commit{self.commit_counter}"])
+
+    def merge(self, branch: str):
+        """Merge `branch` into current branch keeping content of current branch."""
+        self.commit_counter += 1
+        self.run_dated_command(["git", "merge", "-s", "ours", "-m", f"commit{self.commit_counter}", branch])
+
+    def run_dated_command(self, args: Sequence[str]):
+        # Both dates are set so that git log orders commits by current_dt
+        date = self.current_dt.isoformat()
+        env = {**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date}
+        subprocess.run(args, cwd=self.repo.root, env=env, check=True, stdout=subprocess.DEVNULL)
+
+    def generate_config(
+        self,
+        pattern: str,
+        ignore_commits_before: Optional[datetime.datetime] = None,
+        detect_renames: Optional[bool] = None,
+    ):
         config = {"pattern": pattern, "ignore_commits_before": ignore_commits_before}
+        if detect_renames is not None:
+            config["detect_renames"] = detect_renames
         with self.config_file.open("wt", encoding="utf-8") as f:
             yaml.dump(config, f)
 
@@ -167,6 +175,51 @@ def test_file_move_with_modification():
         assert r.load_first_line("b.txt") == f"# (c) {r.current_dt.year - 1}-{r.current_dt.year}, developers"
 
 
+def test_committed_file_move_does_not_change_year():
+    with temporary_repository() as r:
+        r.generate_config("# (c) {years}, developers")
+        r.modify_file("a.txt", header=f"# (c) {r.current_dt.year}, developers")
+        r.commit()
+        r.skip_year()
+        r.move_file("a.txt", "b.txt")
+        r.commit()
+        assert not r.run_copyright_updater_on_all_files()
+
+
+def test_file_move_without_rename_detection():
+    with temporary_repository() as r:
+        r.generate_config("# (c) {years}, developers", detect_renames=False)
+        r.modify_file("a.txt", header=f"# (c) {r.current_dt.year}, developers")
+        r.commit()
+        r.skip_year()
+        r.move_file("a.txt", "b.txt")
+        r.commit()
+        assert r.run_copyright_updater_on_all_files()
+        assert r.load_first_line("b.txt") == f"# (c) {r.current_dt.year - 1}-{r.current_dt.year}, developers"
+
+
+def test_history_cache_with_merged_older_commits():
+    with temporary_repository() as r:
+        r.generate_config("# (c) {years}, developers")
+        r.modify_file("a.txt", header=f"# (c) {r.current_dt.year}, developers")
+        r.commit()
+        r.run_command(["git", "branch", "side"])
+        r.skip_year()
+        r.skip_year()
+        r.modify_file("a.txt", header=f"# (c) {r.current_dt.year}, developers")
+        r.commit()
+        assert not r.run_copyright_updater_on_all_files()
+        # Older commit reachable only through the merge must not override the newer one
+        r.run_command(["git", "checkout", "-q", "side"])
+        r.current_dt = r.current_dt.replace(year=r.current_dt.year - 1)
+        r.modify_file("a.txt", header=f"# (c) {r.current_dt.year}, developers")
+        r.commit()
+        r.run_command(["git", "checkout", "-q", "main"])
+        r.skip_year()
+        r.merge("side")
+        assert not r.run_copyright_updater_on_all_files()
+
+
 def test_ignore_commits_before():
     with temporary_repository() as r:
         r.modify_file("a.txt", header=f"# (c) {r.current_dt.year - 1}, developers")
@@ -184,3 +237,38 @@ def test_file_out_of_repo():
             assert not r.run_copyright_updater(["a.txt", "../out.txt"])
         with pytest.raises(FatalException, match=OUTSIDE_OF_REPOSITORY):
             assert not r.run_copyright_updater(["../out.txt"])
+
+
+def test_dangling_config_symlink_is_skipped():
+    with temporary_repository() as r:
+        r.generate_config("# (c) {years}, developers")
+        r.config_file.rename(r.repo.root / ".copyright-updater.yml")
+        r.config_file.symlink_to(r.repo.root / "missing.yaml")
+        r.modify_file("a.txt", header=f"# (c) {r.current_dt.year - 1}, developers")
+        r.commit()
+        assert r.run_copyright_updater_on_all_files()
+
+
+def test_config_change_invalidates_cache():
+    with temporary_repository() as r:
+        r.generate_config("# (c) {years}, developers")
+        r.modify_file("a.txt", header=f"# Copyright {r.current_dt.year - 1}")
+        r.commit()
+        assert not r.run_copyright_updater_on_all_files()
+        assert (r.repo.git_dir / "copyrighthook-config.cache").exists()
+        r.generate_config("# Copyright {years}")
+        assert r.run_copyright_updater_on_all_files()
+
+
+def test_history_cache_follows_new_commits():
+    with temporary_repository() as r:
+        r.generate_config("# (c) {years}, developers")
+        r.modify_file("a.txt", header=f"# (c) {r.current_dt.year}, developers")
+        r.commit()
+        assert not r.run_copyright_updater_on_all_files()
+        assert (r.repo.git_dir / "copyrighthook-history.cache").exists()
+        r.skip_year()
+        r.modify_file("a.txt", header=f"# (c) {r.current_dt.year - 1}, developers")
+        r.commit()
+        assert r.run_copyright_updater_on_all_files()
+        assert r.load_first_line("a.txt") == f"# (c) {r.current_dt.year - 1}-{r.current_dt.year}, developers"
@@ -27,3 +27,27 @@ def test_update_file(content: str, expected: str, expected_ok: bool, required: b
     )
     assert (not error_comment) == expected_ok
     assert new_content == expected
+
+
+@pytest.mark.parametrize("pattern", ["# (c) {years}", "{years} developers", "{years}"])
+@pytest.mark.parametrize(
+    "offset",
+    [0, YearsPattern.header_size - 12, YearsPattern.header_size - 5, YearsPattern.header_size * 2],
+)
+def test_extract_at_any_offset(pattern: str, offset: int):
+    header = pattern.replace(YearsPattern.placeholder, "2021-2023")
+    content = "x" * offset + header + "\n" + "y" * YearsPattern.header_size
+    assert YearsPattern(pattern).extract(content) == ("2021", "2023")
+
+
+@pytest.mark.parametrize(
+    "pattern,content,expected",
+    [
+        ("# (c) {years}", "# (c) unknown\n# (c) 2020\n", "2020"),
+        ("# (c) {years}", "# (c)\n", None),
+        ("{years} developers", "2019 -2021 developers\n", ("2019", "2021")),
+        ("{years} developers", "2019 developer\n", None),
+    ],
+)
+def test_extract(pattern: str, content: str, expected):
+    assert YearsPattern(pattern).extract(content) == expected